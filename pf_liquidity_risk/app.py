@@ -15,7 +15,7 @@ import time
 
 # Import your simulation components
 from pf_liquidity_risk.modeling.config_model import PFConfig
-from pf_liquidity_risk.modeling.train import PFInvestmentModel
+from pf_liquidity_risk.modeling.train import PFInvestmentModel, exit_mask, survival_rates
 
 # ==========================================
 # Translations
@@ -311,15 +311,14 @@ st.markdown("""
 def run_simulation_cached(config_dict: dict, iterations: int, seed: int) -> pd.DataFrame:
     """Run simulation with caching for performance"""
     config = PFConfig(**config_dict)
-    np.random.seed(seed)
     model = PFInvestmentModel(config)
-    results = [model.simulate_path() for _ in range(iterations)]
-    return pd.DataFrame(results)
+    return model.simulate_batch(iterations, np.random.default_rng(seed))
 
 
 def create_outcome_chart(df: pd.DataFrame, lang: str) -> go.Figure:
     """Create interactive outcome distribution chart"""
     counts = df["status"].value_counts()
+    counts = counts[counts > 0]
     percentages = (counts / len(df) * 100).round(2)
     
     color_map = {
@@ -361,7 +360,7 @@ def create_outcome_chart(df: pd.DataFrame, lang: str) -> go.Figure:
 
 def create_irr_histogram(df: pd.DataFrame, lang: str) -> go.Figure:
     """Create IRR distribution histogram"""
-    exit_df = df[df["status"] == "exit"]
+    exit_df = df[exit_mask(df)]
     
     if exit_df.empty:
         fig = go.Figure()
@@ -416,17 +415,13 @@ def create_irr_histogram(df: pd.DataFrame, lang: str) -> go.Figure:
 def create_survival_curve(df: pd.DataFrame, iterations: int, lang: str) -> go.Figure:
     """Create survival rate curve"""
     months = np.arange(1, 37)
-    survival_rates = []
-    
-    for m in months:
-        failed = df[df["status"].isin(["default", "refi_fail"]) & (df["month"] <= m)]
-        survival_rates.append((iterations - len(failed)) / iterations)
+    survival = survival_rates(df, iterations, len(months))
     
     fig = go.Figure()
     
     fig.add_trace(go.Scatter(
         x=months,
-        y=survival_rates,
+        y=survival,
         mode='lines+markers',
         name=t('survival_rate', lang),
         line=dict(color='#8E44AD', width=3),
@@ -455,7 +450,7 @@ def create_survival_curve(df: pd.DataFrame, iterations: int, lang: str) -> go.Fi
 
 def create_exit_multiple_chart(df: pd.DataFrame, lang: str) -> go.Figure:
     """Create exit multiple distribution"""
-    exit_df = df[df["status"] == "exit"]
+    exit_df = df[exit_mask(df)]
     
     if exit_df.empty or "exit_multiple" not in exit_df.columns:
         fig = go.Figure()
@@ -788,11 +783,13 @@ def main():
             st.session_state['base_case'] = None
         
         # Calculate current metrics
-        exit_prob = len(df[df["status"] == "exit"]) / len(df) * 100
-        default_prob = len(df[df["status"] == "default"]) / len(df) * 100
-        refi_fail_prob = len(df[df["status"] == "refi_fail"]) / len(df) * 100
+        status = df["status"].to_numpy()
+        is_exit = status == "exit"
+        exit_prob = is_exit.mean() * 100
+        default_prob = (status == "default").mean() * 100
+        refi_fail_prob = (status == "refi_fail").mean() * 100
         
-        exit_df = df[df["status"] == "exit"]
+        exit_df = df[is_exit]
         median_irr = exit_df["irr"].median() if not exit_df.empty else 0
         
         loss = initial_equity - df["final_equity"]
@@ -7,11 +7,12 @@ from dataclasses import dataclass, field
 from typing import Dict, Tuple
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PFConfig:
     """
     Configuration for Real Estate PF Investment Monte Carlo Simulation.
     Encapsulates all financial parameters and stochastic distributions.
+    Frozen and slotted: use dataclasses.replace to derive scenario variants.
     """
 
     # Capital Structure (normalized units)
@@ -51,8 +52,9 @@ class PFConfig:
     capitalized_ratio_map: Dict[str, float] = field(default_factory=dict, init=False)
 
     def __post_init__(self):
-        self.capitalized_ratio_map = {
+        # Frozen dataclass: bypass __setattr__ for the derived field
+        object.__setattr__(self, "capitalized_ratio_map", {
             "construction": 1.0,   # Full interest capitalization during building
             "stabilization": 0.4,  # Partial capitalization during ramp-up
             "exit": 0.0            # No capitalization post-exit/court-opening
-        }
\ No newline at end of file
+        })
\ No newline at end of file
@@ -1,7 +1,23 @@
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from dataclasses import dataclass, fields
+import multiprocessing
+import os
+
 import numpy as np
 import pandas as pd
+import matplotlib
+
+# Headless backend: figures are only ever written to disk
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
-from typing import Dict, List
+from tqdm import tqdm
+from typing import List, Optional, Tuple
 from pathlib import Path
 
 # Import config model (no circular dependency)
@@ -16,6 +32,60 @@ except ImportError:
     from pf_liquidity_risk.configs import public_config as config_module
     print("[CONFIG] Using public configuration (normalized data)")
 
+# Numba is optional - fall back to the vectorized NumPy engine without it
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+
+# Integer outcome codes used by the batch engines
+STATUS_LABELS = ("default", "refi_fail", "exit", "survived_no_exit")
+STATUS_DEFAULT, STATUS_REFI_FAIL, STATUS_EXIT, STATUS_SURVIVED = range(len(STATUS_LABELS))
+
+@dataclass
+class SimResults:
+    """
+    Per-trial simulation outputs stored as one array per field (indexed by trial).
+    Allocated once per run and filled in place by the simulation engines.
+    """
+    status_code: np.ndarray
+    month: np.ndarray
+    final_equity: np.ndarray
+    irr: np.ndarray
+    exit_multiple: np.ndarray
+    principal_at_refi: np.ndarray
+    refi_loan_amount: np.ndarray
+
+    @classmethod
+    def allocate(cls, n: int, exit_month: int) -> "SimResults":
+        return cls(
+            status_code=np.full(n, STATUS_SURVIVED, dtype=np.int8),
+            month=np.full(n, exit_month, dtype=np.int16),
+            final_equity=np.zeros(n),
+            irr=np.zeros(n),
+            exit_multiple=np.full(n, np.nan),
+            principal_at_refi=np.zeros(n),
+            refi_loan_amount=np.zeros(n),
+        )
+
+    def to_frame(self) -> pd.DataFrame:
+        """Wraps the result arrays in the simulation DataFrame."""
+        return pd.DataFrame({
+            "status": pd.Categorical.from_codes(self.status_code, categories=STATUS_LABELS),
+            "month": self.month,
+            "final_equity": self.final_equity,
+            "irr": self.irr,
+            "exit_multiple": self.exit_multiple,
+            "principal_at_refi": self.principal_at_refi,
+            "refi_loan_amount": self.refi_loan_amount,
+        }, copy=False)
+
 
 # ==========================================
 # Simulation Engine
@@ -28,9 +98,27 @@ class PFInvestmentModel:
     """
     def __init__(self, config: PFConfig):
         self.cfg = config
+        # Capitalization ratios indexed by phase code (construction, stabilization, exit)
+        self._cap_ratios = (
+            config.capitalized_ratio_map["construction"],
+            config.capitalized_ratio_map["stabilization"],
+            config.capitalized_ratio_map["exit"],
+        )
 
-    def simulate_path(self) -> Dict:
-        equity = self.cfg.initial_equity
+    def simulate_path(self) -> Tuple[int, int, float, float, float, float, float]:
+        """
+        Simulates a single trial with scalar arithmetic.
+        Returns one value per SimResults field, in field order.
+        """
+        # Hoist config reads used inside the monthly loop
+        fixed = self.cfg.monthly_fixed_cost
+        court_m = self.cfg.court_opening_month
+        exit_m = self.cfg.exit_month
+        cap_rate = self.cfg.cap_rate
+        initial_equity = self.cfg.initial_equity
+        cap_ratios = self._cap_ratios
+
+        equity = initial_equity
         principal = self.cfg.senior_loan
         revenue_history: List[float] = []
 
@@ -55,27 +143,27 @@ class PFInvestmentModel:
         refinanced = False
         current_rate = pre_refi_rate
 
-        for m in range(1, self.cfg.exit_month + 1):
+        for m in range(1, exit_m + 1):
             # Phase determination
             if m < completion_month:
-                phase, revenue = "construction", 0
-            elif m < self.cfg.court_opening_month:
-                phase, revenue = "stabilization", sampled_stab_rev
+                phase_idx, revenue = 0, 0
+            elif m < court_m:
+                phase_idx, revenue = 1, sampled_stab_rev
             else:
-                phase, revenue = "exit", sampled_post_rev
+                phase_idx, revenue = 2, sampled_post_rev
 
             revenue_history.append(revenue)
 
             # Interest rate logic
             monthly_rate = current_rate / 12
             interest = principal * monthly_rate
-            cap_ratio = self.cfg.capitalized_ratio_map[phase]
+            cap_ratio = cap_ratios[phase_idx]
 
             paid_interest = interest * (1 - cap_ratio)
             principal += (interest * cap_ratio)
 
             # Operating Cash Flow & Principal Sweep
-            net_cash_flow = revenue - (self.cfg.monthly_fixed_cost + paid_interest)
+            net_cash_flow = revenue - (fixed + paid_interest)
             
             if net_cash_flow > 0:
                 principal -= net_cash_flow
@@ -87,18 +175,18 @@ class PFInvestmentModel:
 
             # Construction delay impact
             if m == completion_month and delay > 0:
-                equity -= delay * self.cfg.monthly_fixed_cost * 0.6
+                equity -= delay * fixed * 0.6
 
             # Insolvency Check
             if equity <= 0:
-                return {"status": "default", "month": m, "final_equity": 0, "irr": -1.0}
+                return STATUS_DEFAULT, m, 0.0, -1.0, np.nan, np.nan, np.nan
 
             # Refinancing Viability Check (Month (Completion + 3))
             if m == refi_month:
                 ltv_limit = np.random.triangular(*self.cfg.target_refi_ltv_dist)
                 operating_history = [rev for rev in revenue_history[-3:] if rev > 0]
                 rolling_noi = np.mean(operating_history) if operating_history else revenue
-                implied_val = (rolling_noi * 12) / self.cfg.cap_rate
+                implied_val = (rolling_noi * 12) / cap_rate
 
                 max_refi_loan = implied_val * ltv_limit
                 principal_at_refi = principal
@@ -106,65 +194,431 @@ class PFInvestmentModel:
                 
                 if principal > (implied_val * ltv_limit):
                     # Refinancing failed
-                    return {
-                        "status": "refi_fail",
-                        "month": m,
-                        "final_equity": 0,
-                        "irr": -1.0,
-                        "principal_at_refi": principal_at_refi, "refi_loan_amount": refi_loan_amount
-                        }
+                    return (
+                        STATUS_REFI_FAIL, m, 0.0, -1.0, np.nan,
+                        principal_at_refi, refi_loan_amount,
+                    )
                 else:
                     # Refinancing succeeded - switch to lower rate
                     refinanced = True
                     current_rate = post_refi_rate
 
-            # Final Exit Transaction
-            if m == self.cfg.exit_month:
-                final_val = (revenue * 12) / self.cfg.cap_rate
-                exit_cost = final_val * np.random.uniform(*self.cfg.exit_cost_range)
-                exit_equity = final_val - principal - exit_cost
+        # Final Exit Transaction (every path that survives the loop exits at exit_m)
+        final_val = (revenue * 12) / cap_rate
+        exit_cost = final_val * np.random.uniform(*self.cfg.exit_cost_range)
+        exit_equity = final_val - principal - exit_cost
+
+        if exit_equity > 0:
+            total_return = exit_equity / initial_equity
+            years = exit_m / 12
+            irr = (total_return ** (1 / years)) - 1
+        else:
+            irr = -1.0
+
+        return (
+            STATUS_EXIT, exit_m, max(0.0, exit_equity), irr,
+            exit_equity / initial_equity if exit_equity > 0 else 0.0,
+            principal_at_refi, refi_loan_amount,
+        )
 
-                if exit_equity > 0:
-                    total_return = exit_equity / self.cfg.initial_equity
-                    years = m / 12
-                    irr = (total_return ** (1 / years)) - 1
-                else:
-                    irr = -1.0
-                
-                return {
-                    "status": "exit", "month": m, "final_equity": max(0, exit_equity), "irr": irr,
-                    "exit_multiple": exit_equity / self.cfg.initial_equity if exit_equity > 0 else 0,
-                    "principal_at_refi": principal_at_refi, "refi_loan_amount": refi_loan_amount
-                }
+    def simulate_paths(self, n: int) -> pd.DataFrame:
+        """
+        Runs n trials through simulate_path, writing each into preallocated
+        result columns so the DataFrame is built once from arrays.
+        """
+        out = SimResults.allocate(n, self.cfg.exit_month)
+        columns = [getattr(out, field.name) for field in fields(SimResults)]
+        for i in range(n):
+            for column, value in zip(columns, self.simulate_path()):
+                column[i] = value
+        return out.to_frame()
+
+    def _sample_trials(
+        self, n: int, rng: Optional[np.random.Generator] = None
+    ) -> Tuple[np.ndarray, ...]:
+        """
+        Draws every random per-trial input for the batch engines.
+        Returns (pre_refi_rate, post_refi_rate, stab_rev, post_rev,
+        completion_month, ltv_limit, exit_cost_ratio), each of length n.
+        """
+        cfg = self.cfg
+        if rng is None:
+            rng = np.random.default_rng()
+
+        # Sample every triangular per-trial parameter in a single call
+        left, mode, right = np.array([
+            cfg.pre_refi_rate,
+            cfg.post_refi_rate,
+            cfg.stabilization_revenue_dist,
+            cfg.post_court_revenue_dist,
+            (0, 2, 6),  # Completion delay (months)
+            cfg.target_refi_ltv_dist,
+        ], dtype=float).T[:, :, None]
+        (
+            pre_refi_rate,
+            post_refi_rate,
+            sampled_stab_rev,
+            sampled_post_rev,
+            sampled_delay,
+            ltv_limit,
+        ) = rng.triangular(left, mode, right, size=(6, n))
+        exit_cost_ratio = rng.uniform(*cfg.exit_cost_range, size=n)
+
+        completion_month = cfg.completion_target_month + sampled_delay.astype(np.int64)
+        return (
+            pre_refi_rate,
+            post_refi_rate,
+            sampled_stab_rev,
+            sampled_post_rev,
+            completion_month,
+            ltv_limit,
+            exit_cost_ratio,
+        )
+
+    def simulate_batch(
+        self, n: int, rng: Optional[np.random.Generator] = None, dtype=np.float64
+    ) -> pd.DataFrame:
+        """
+        Vectorized counterpart of simulate_path.
+        Samples all n trials up front and runs the monthly time loop once,
+        holding the project state as length-n arrays with an alive mask.
+        dtype sets the precision of the monthly cash-flow state and schedules.
+        """
+        cfg = self.cfg
+        n_months = cfg.exit_month
+        (
+            pre_refi_rate,
+            post_refi_rate,
+            sampled_stab_rev,
+            sampled_post_rev,
+            completion_month,
+            ltv_limit,
+            exit_cost_ratio,
+        ) = self._sample_trials(n, rng)
+        delay = np.maximum(0, completion_month - cfg.completion_target_month)
+
+        refi_month = completion_month + 3
+
+        cap_ratio_by_phase = np.array(self._cap_ratios)
+
+        # (n, T) schedules for every trial-month. Phase codes come from two
+        # comparisons (construction until completion, exit from court opening)
+        # and index per-phase lookup tables.
+        months = np.arange(1, n_months + 1)
+        completed = months >= completion_month[:, None]
+        phase_of_month = completed * (1 + (months >= cfg.court_opening_month))
+        revenue_by_phase = np.stack(
+            [np.zeros(n), sampled_stab_rev, sampled_post_rev], axis=1
+        ).astype(dtype)
+        revenue_matrix = np.take_along_axis(revenue_by_phase, phase_of_month, axis=1)
+        cap_ratio_matrix = cap_ratio_by_phase.astype(dtype)[phase_of_month]
+        # Paths that fail refinancing are terminated, so every path still
+        # running after its refi month is on the post-refi rate.
+        rate_matrix = np.where(
+            months > refi_month[:, None], post_refi_rate[:, None], pre_refi_rate[:, None]
+        ).astype(dtype) / 12
+
+        # Project state
+        equity = np.full(n, cfg.initial_equity, dtype=dtype)
+        principal = np.full(n, cfg.senior_loan, dtype=dtype)
+        alive = np.ones(n, dtype=bool)
+
+        out = SimResults.allocate(n, n_months)
+
+        for m in months:
+            revenue = revenue_matrix[:, m - 1]
+
+            # Interest rate logic
+            interest = principal * rate_matrix[:, m - 1]
+            cap_ratio = cap_ratio_matrix[:, m - 1]
+
+            paid_interest = interest * (1 - cap_ratio)
+            principal += interest * cap_ratio
+
+            # Operating Cash Flow & Principal Sweep
+            # Surplus sweeps principal (overflow to equity), deficits drain equity
+            net_cash_flow = revenue - (cfg.monthly_fixed_cost + paid_interest)
+            paydown = np.clip(net_cash_flow, 0, principal)
+            principal -= paydown
+            equity += net_cash_flow - paydown
+
+            # Construction delay impact
+            equity -= (m == completion_month) * delay * cfg.monthly_fixed_cost * 0.6
+
+            # Insolvency Check
+            defaulted = alive & (equity <= 0)
+            out.status_code[defaulted] = STATUS_DEFAULT
+            out.month[defaulted] = m
+            out.irr[defaulted] = -1.0
+            alive &= ~defaulted
+
+            # Refinancing Viability Check (Month (Completion + 3))
+            at_refi = alive & (m == refi_month)
+            if at_refi.any():
+                window = revenue_matrix[at_refi, max(0, m - 3):m]
+                operating = window > 0
+                n_operating = operating.sum(axis=1)
+                rolling_noi = np.where(
+                    n_operating > 0,
+                    (window * operating).sum(axis=1) / np.maximum(n_operating, 1),
+                    revenue[at_refi],
+                )
+                implied_val = (rolling_noi * 12) / cfg.cap_rate
+
+                max_refi_loan = implied_val * ltv_limit[at_refi]
+                out.principal_at_refi[at_refi] = principal[at_refi]
+                out.refi_loan_amount[at_refi] = max_refi_loan
+
+                refi_failed = np.zeros(n, dtype=bool)
+                refi_failed[at_refi] = principal[at_refi] > max_refi_loan
+                out.status_code[refi_failed] = STATUS_REFI_FAIL
+                out.month[refi_failed] = m
+                out.irr[refi_failed] = -1.0
+                alive &= ~refi_failed
+
+        # Final Exit Transaction
+        final_val = (revenue * 12) / cfg.cap_rate
+        exit_equity = final_val - principal - final_val * exit_cost_ratio
+        total_return = np.maximum(exit_equity, 0) / cfg.initial_equity
+        exit_irr = np.where(exit_equity > 0, total_return ** (12 / n_months) - 1, -1.0)
+
+        out.status_code[alive] = STATUS_EXIT
+        out.final_equity[alive] = np.maximum(exit_equity, 0)[alive]
+        out.irr[alive] = exit_irr[alive]
+        out.exit_multiple[alive] = total_return[alive]
+
+        # Defaulted paths never report refinancing figures
+        out.principal_at_refi[out.status_code == STATUS_DEFAULT] = np.nan
+        out.refi_loan_amount[out.status_code == STATUS_DEFAULT] = np.nan
+
+        return out.to_frame()
+
+    def simulate_jit(self, n: int, rng: Optional[np.random.Generator] = None) -> pd.DataFrame:
+        """
+        Runs n trials through the compiled per-trial kernel.
+        Random inputs are drawn on the host with the same sampler as
+        simulate_batch, so both engines agree for a given generator state.
+        """
+        cfg = self.cfg
+        out = SimResults.allocate(n, cfg.exit_month)
+        _trial_kernel(
+            *self._sample_trials(n, rng),
+            float(cfg.initial_equity), float(cfg.senior_loan), float(cfg.monthly_fixed_cost),
+            float(cfg.cap_rate),
+            cfg.completion_target_month, cfg.court_opening_month, cfg.exit_month,
+            np.array(self._cap_ratios, dtype=float),
+            out.status_code, out.month, out.final_equity, out.irr,
+            out.exit_multiple, out.principal_at_refi, out.refi_loan_amount,
+        )
+        return out.to_frame()
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _trial_kernel(
+    pre_refi_rates, post_refi_rates, stab_revs, post_revs,
+    completion_months, ltv_limits, exit_cost_ratios,
+    initial_equity, senior_loan, monthly_fixed_cost,
+    cap_rate, completion_target_month, court_opening_month, exit_month,
+    cap_ratios,
+    status_code, month, final_equity, irr, exit_multiple, principal_at_refi, refi_loan_amount,
+):
+    """
+    Scalar simulate_path logic compiled to native code and fused into one
+    pass per trial, with the monthly state held in locals. Trials run in
+    parallel across cores on pre-sampled inputs and write their outcomes
+    into the preallocated SimResults arrays passed in.
+    """
+    for i in prange(len(completion_months)):
+        pre_refi_rate = pre_refi_rates[i]
+        post_refi_rate = post_refi_rates[i]
+        sampled_stab_rev = stab_revs[i]
+        sampled_post_rev = post_revs[i]
+
+        completion_month = completion_months[i]
+        delay = max(0, completion_month - completion_target_month)
+        refi_month = completion_month + 3
+
+        equity = initial_equity
+        principal = senior_loan
+        current_rate = pre_refi_rate
+        # Revenue of the last three months, most recent first
+        rev_1 = rev_2 = rev_3 = 0.0
+        final_equity[i] = equity
+
+        for m in range(1, exit_month + 1):
+            # Phase determination
+            if m < completion_month:
+                phase, revenue = 0, 0.0
+            elif m < court_opening_month:
+                phase, revenue = 1, sampled_stab_rev
+            else:
+                phase, revenue = 2, sampled_post_rev
+            rev_1, rev_2, rev_3 = revenue, rev_1, rev_2
 
-        return {
-            "status": "survived_no_exit", "month": self.cfg.exit_month, "final_equity": equity, "irr": 0.0,
-            "principal_at_refi": principal_at_refi, "refi_loan_amount": refi_loan_amount
-            }
+            # Interest rate logic
+            interest = principal * current_rate / 12
+            cap_ratio = cap_ratios[phase]
+
+            paid_interest = interest * (1 - cap_ratio)
+            principal += interest * cap_ratio
+
+            # Operating Cash Flow & Principal Sweep
+            # Surplus sweeps principal (overflow to equity), deficits drain equity
+            net_cash_flow = revenue - (monthly_fixed_cost + paid_interest)
+            paydown = min(max(net_cash_flow, 0.0), principal)
+            principal -= paydown
+            equity += net_cash_flow - paydown
+
+            # Construction delay impact
+            if m == completion_month and delay > 0:
+                equity -= delay * monthly_fixed_cost * 0.6
+
+            # Insolvency Check
+            if equity <= 0:
+                status_code[i] = STATUS_DEFAULT
+                month[i] = m
+                final_equity[i] = 0.0
+                irr[i] = -1.0
+                principal_at_refi[i] = np.nan
+                refi_loan_amount[i] = np.nan
+                break
+
+            # Refinancing Viability Check (Month (Completion + 3))
+            if m == refi_month:
+                ltv_limit = ltv_limits[i]
+                noi_total = 0.0
+                n_operating = 0
+                for rev in (rev_1, rev_2, rev_3):
+                    if rev > 0:
+                        noi_total += rev
+                        n_operating += 1
+                rolling_noi = noi_total / n_operating if n_operating > 0 else revenue
+                implied_val = (rolling_noi * 12) / cap_rate
+
+                principal_at_refi[i] = principal
+                refi_loan_amount[i] = implied_val * ltv_limit
+
+                if principal > implied_val * ltv_limit:
+                    status_code[i] = STATUS_REFI_FAIL
+                    month[i] = m
+                    final_equity[i] = 0.0
+                    irr[i] = -1.0
+                    break
+                current_rate = post_refi_rate
+
+        # Final Exit Transaction for paths still running after exit_month
+        if status_code[i] == STATUS_SURVIVED:
+            final_val = (revenue * 12) / cap_rate
+            exit_equity = final_val - principal - final_val * exit_cost_ratios[i]
+
+            status_code[i] = STATUS_EXIT
+            if exit_equity > 0:
+                final_equity[i] = exit_equity
+                exit_multiple[i] = exit_equity / initial_equity
+                irr[i] = exit_multiple[i] ** (12 / exit_month) - 1
+            else:
+                final_equity[i] = 0.0
+                exit_multiple[i] = 0.0
+                irr[i] = -1.0
 
 
 # ==========================================
 # Execution & Visualization
 # ==========================================
 
-def run_simulation(iterations: int = 30000, seed: int = 42, config: PFConfig = None):
-    """Executes the Monte Carlo simulation engine across specified iterations."""
-    np.random.seed(seed)
-    
+# Parse the report style sheet once rather than on every dashboard render
+plt.style.use("seaborn-v0_8-muted")
+
+
+def _worker(
+    config: PFConfig, n_per_worker: int, seed_seq: np.random.SeedSequence
+) -> pd.DataFrame:
+    """Runs one chunk of trials through the NumPy batch engine in a worker process."""
+    rng = np.random.default_rng(seed_seq)
+    return PFInvestmentModel(config).simulate_batch(n_per_worker, rng)
+
+
+def run_simulation(
+    iterations: int = 30000,
+    seed: int = 42,
+    config: PFConfig = None,
+    num_workers: Optional[int] = 1,
+):
+    """
+    Executes the Monte Carlo simulation engine across specified iterations.
+    With num_workers=1 the trials run in-process on the compiled Numba kernel
+    when available, otherwise on the NumPy batch engine. Any other value
+    splits the trials across that many processes (None: one per CPU core),
+    each drawing from an independent stream spawned from the master seed.
+    """
     if config is None:
         config = config_module.get_config()
     
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+
+    if num_workers > 1:
+        chunks = np.array_split(np.arange(iterations), num_workers)
+        child_seeds = np.random.SeedSequence(seed).spawn(num_workers)
+        # Spawn rather than fork: the parent may already be running Numba threads
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=num_workers, mp_context=context) as executor:
+            futures = [
+                executor.submit(_worker, config, len(chunk), child_seed)
+                for chunk, child_seed in zip(chunks, child_seeds)
+            ]
+            # One progress tick per worker chunk; the trials themselves stay unwrapped
+            for _ in tqdm(as_completed(futures), total=num_workers, desc="Simulating"):
+                pass
+            frames = [future.result() for future in futures]
+        return pd.concat(frames, ignore_index=True), config
+
     model = PFInvestmentModel(config)
-    results = [model.simulate_path() for _ in range(iterations)]
-    return pd.DataFrame(results), config
+    rng = np.random.default_rng(seed)
+    if NUMBA_AVAILABLE:
+        return model.simulate_jit(iterations, rng), config
+    return model.simulate_batch(iterations, rng), config
 
 
-def plot_enhanced_results(df: pd.DataFrame, iterations: int, config: PFConfig, filename: str):
+def survival_rates(df: pd.DataFrame, iterations: int, n_months: int) -> np.ndarray:
+    """
+    Share of trials that have not defaulted or failed refinancing by the end
+    of each month 1..n_months, from a single bincount over failure months.
+    """
+    failed = df["status"].isin(["default", "refi_fail"]).to_numpy()
+    failure_months = df["month"].to_numpy()[failed].astype(np.intp)
+    failures = np.bincount(failure_months, minlength=n_months + 1)[1:n_months + 1]
+    return (iterations - np.cumsum(failures)) / iterations
+
+
+def exit_mask(df: pd.DataFrame) -> np.ndarray:
+    """Boolean ndarray selecting the trials that reached the exit transaction."""
+    status = df["status"]
+    if isinstance(status.dtype, pd.CategoricalDtype):
+        # Compare the integer codes instead of materialising the labels
+        return status.cat.codes.to_numpy() == status.cat.categories.get_loc("exit")
+    return status.to_numpy() == "exit"
+
+
+def _save_figure(fig: plt.Figure, save_path: Path) -> Path:
+    """Encode the figure to disk and release it."""
+    fig.savefig(save_path, dpi=300, bbox_inches='tight')
+    plt.close(fig)
+    return save_path
+
+
+def plot_enhanced_results(
+    df: pd.DataFrame,
+    iterations: int,
+    config: PFConfig,
+    filename: str,
+    executor: Optional[Executor] = None,
+) -> Optional[Future]:
     """
     Generates an analytical dashboard and saves it to the reports/figures directory.
     Uses semantic color mapping for project status.
+    With an executor the PNG encode runs in the background and its future is returned.
     """
-    plt.style.use("seaborn-v0_8-muted")
     fig, axes = plt.subplots(2, 2, figsize=(18, 12))
     axes = axes.flatten()
 
@@ -178,6 +632,7 @@ def plot_enhanced_results(df: pd.DataFrame, iterations: int, config: PFConfig, f
 
     # 1. Outcome Distribution
     counts = df["status"].value_counts()
+    counts = counts[counts > 0]
     colors = [color_map.get(s, "#BDC3C7") for s in counts.index]
     counts.plot(kind="bar", ax=axes[0], color=colors, edgecolor='black')
     axes[0].set_title("Project Outcome Distribution", fontweight='bold', fontsize=12)
@@ -186,17 +641,16 @@ def plot_enhanced_results(df: pd.DataFrame, iterations: int, config: PFConfig, f
     plt.setp(axes[0].get_xticklabels(), rotation=45, ha='right')
     
     # Add percentage labels
-    for i, (idx, val) in enumerate(counts.items()):
-        axes[0].text(i, val, f'{val/iterations*100:.1f}%', 
-                    ha='center', va='bottom', fontweight='bold')
+    axes[0].bar_label(axes[0].containers[0], fontweight='bold',
+                      labels=[f'{val/iterations*100:.1f}%' for val in counts])
 
     # 2. Equity IRR Histogram
-    exit_df = df[df["status"] == "exit"]
-    if not exit_df.empty:
-        exit_df["irr"].plot(kind="hist", bins=50, ax=axes[1], 
-                           color='#3498DB', alpha=0.7, edgecolor='black')
-        median_irr = exit_df["irr"].median()
-        mean_irr = exit_df["irr"].mean()
+    is_exit = exit_mask(df)
+    irr_arr = df["irr"].to_numpy()[is_exit]
+    if irr_arr.size:
+        axes[1].hist(irr_arr, bins=50, color='#3498DB', alpha=0.7, edgecolor='black')
+        median_irr = np.median(irr_arr)
+        mean_irr = irr_arr.mean()
         axes[1].axvline(median_irr, color='red', linestyle='--', 
                        linewidth=2, label=f'Median: {median_irr:.1%}')
         axes[1].axvline(mean_irr, color='green', linestyle='--', 
@@ -209,14 +663,11 @@ def plot_enhanced_results(df: pd.DataFrame, iterations: int, config: PFConfig, f
 
     # 3. Survival Curve
     months = np.arange(1, 37)
-    survival_rates = []
-    for m in months:
-        failed = df[df["status"].isin(["default", "refi_fail"]) & (df["month"] <= m)]
-        survival_rates.append((iterations - len(failed)) / iterations)
+    survival = survival_rates(df, iterations, len(months))
     
-    axes[2].plot(months, survival_rates, marker='o', markersize=4, 
+    axes[2].plot(months, survival, marker='o', markersize=4, 
                 linewidth=2, color='#8E44AD')
-    axes[2].fill_between(months, 0, survival_rates, alpha=0.3, color='#8E44AD')
+    axes[2].fill_between(months, 0, survival, alpha=0.3, color='#8E44AD')
     axes[2].set_ylim(0, 1.05)
     axes[2].set_title("Project Survival Rate Over Time", fontweight='bold', fontsize=12)
     axes[2].set_xlabel("Month")
@@ -226,10 +677,10 @@ def plot_enhanced_results(df: pd.DataFrame, iterations: int, config: PFConfig, f
     axes[2].text(1, 0.96, '95% Threshold', fontsize=9)
 
     # 4. Exit Multiple Distribution
-    if not exit_df.empty and "exit_multiple" in exit_df.columns:
-        exit_df["exit_multiple"].plot(kind="hist", bins=40, ax=axes[3], 
-                                      color='#27AE60', alpha=0.7, edgecolor='black')
-        median_mult = exit_df["exit_multiple"].median()
+    if irr_arr.size and "exit_multiple" in df.columns:
+        multiple_arr = df["exit_multiple"].to_numpy()[is_exit]
+        axes[3].hist(multiple_arr, bins=40, color='#27AE60', alpha=0.7, edgecolor='black')
+        median_mult = np.median(multiple_arr)
         axes[3].axvline(median_mult, color='red', linestyle='--', 
                        linewidth=2, label=f'Median: {median_mult:.2f}x')
         axes[3].axvline(1.0, color='orange', linestyle=':', 
@@ -240,18 +691,25 @@ def plot_enhanced_results(df: pd.DataFrame, iterations: int, config: PFConfig, f
         axes[3].legend()
         axes[3].grid(True, alpha=0.3)
 
-    plt.tight_layout()
+    fig.tight_layout()
     
     # Save the figure
     save_path = FIGURES_DIR / filename
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    if executor is not None:
+        return executor.submit(_save_figure, fig, save_path)
+    _save_figure(fig, save_path)
     print(f"\n[Visual] Visualization saved to: {save_path}")
-    plt.close()
+    return None
 
 
 def print_summary_table(df: pd.DataFrame, config: PFConfig):
     """Print comprehensive risk analysis summary"""
-    exit_df = df[df["status"] == "exit"]
+    is_exit = exit_mask(df)
+    # Exit IRR moments are reused by the return and Sharpe sections
+    irr_arr = df["irr"].to_numpy()[is_exit]
+    n_exit = irr_arr.size
+    irr_mean = irr_arr.mean() if n_exit else 0.0
+    irr_std = irr_arr.std(ddof=1) if n_exit > 1 else 0.0
     
     print("\n" + "="*70)
     print(f"    STOCHASTIC PF RISK ANALYSIS REPORT ({config.config_type})")
@@ -266,27 +724,29 @@ def print_summary_table(df: pd.DataFrame, config: PFConfig):
     
     print("\n[Outcome Probabilities]")
     print("-" * 70)
-    for status, count in df["status"].value_counts().items():
+    counts = df["status"].value_counts()
+    for status, count in counts[counts > 0].items():
         prob = count / len(df) * 100
         print(f"  {status:20s}: {prob:>6.2f}% ({count:>6,} cases)")
     
-    print("\n[Return Metrics - Exit Cases Only (n={:,})]".format(len(exit_df)))
+    print("\n[Return Metrics - Exit Cases Only (n={:,})]".format(n_exit))
     print("-" * 70)
-    if not exit_df.empty:
-        print(f"  Mean IRR             : {exit_df['irr'].mean():>8.2%}")
-        print(f"  Median IRR           : {exit_df['irr'].median():>8.2%}")
-        print(f"  Std Dev IRR          : {exit_df['irr'].std():>8.2%}")
-        print(f"  25th Percentile      : {exit_df['irr'].quantile(0.25):>8.2%}")
-        print(f"  75th Percentile      : {exit_df['irr'].quantile(0.75):>8.2%}")
-        if "exit_multiple" in exit_df.columns:
-            print(f"  Mean Exit Multiple   : {exit_df['exit_multiple'].mean():>8.2f}x")
-            print(f"  Median Exit Multiple : {exit_df['exit_multiple'].median():>8.2f}x")
+    if n_exit:
+        irr_p25, irr_median, irr_p75 = np.percentile(irr_arr, [25, 50, 75])
+        print(f"  Mean IRR             : {irr_mean:>8.2%}")
+        print(f"  Median IRR           : {irr_median:>8.2%}")
+        print(f"  Std Dev IRR          : {irr_std:>8.2%}")
+        print(f"  25th Percentile      : {irr_p25:>8.2%}")
+        print(f"  75th Percentile      : {irr_p75:>8.2%}")
+        if "exit_multiple" in df.columns:
+            multiple_arr = df["exit_multiple"].to_numpy()[is_exit]
+            print(f"  Mean Exit Multiple   : {multiple_arr.mean():>8.2f}x")
+            print(f"  Median Exit Multiple : {np.median(multiple_arr):>8.2f}x")
     
     print("\n[Risk Metrics]")
     print("-" * 70)
-    loss = config.initial_equity - df["final_equity"]
-    car_95 = np.percentile(loss, 95)
-    car_99 = np.percentile(loss, 99)
+    loss = config.initial_equity - df["final_equity"].to_numpy()
+    car_95, car_99 = np.percentile(loss, [95, 99])
     expected_loss = loss.mean()
     
     print(f"  Expected Loss        : {expected_loss/config.initial_equity:>8.2%} of equity")
@@ -294,8 +754,8 @@ def print_summary_table(df: pd.DataFrame, config: PFConfig):
     print(f"  99% VaR (CaR)        : {car_99/config.initial_equity:>8.2%} of equity")
     
     # Sharpe Ratio (for exit cases)
-    if len(exit_df) > 0 and exit_df["irr"].std() > 0:
-        sharpe = exit_df["irr"].mean() / exit_df["irr"].std()
+    if n_exit and irr_std > 0:
+        sharpe = irr_mean / irr_std
         print(f"  Sharpe Ratio         : {sharpe:>8.2f}")
     
     print("\n" + "="*70)
@@ -315,11 +775,16 @@ def main():
     print(f"\n[START] Running {iterations:,} Monte Carlo iterations...")
     df, cfg = run_simulation(iterations, config=config)
     
-    # Risk Reporting
-    print_summary_table(df, cfg)
-    
-    # Generate Dashboard
-    plot_enhanced_results(df, iterations, cfg, filename=output_image)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # Generate Dashboard; the PNG encode overlaps with the risk report
+        saved = plot_enhanced_results(
+            df, iterations, cfg, filename=output_image, executor=executor
+        )
+
+        # Risk Reporting
+        print_summary_table(df, cfg)
+
+        print(f"\n[Visual] Visualization saved to: {saved.result()}")
     
     print("\n[COMPLETE] Analysis finished!")
 
@@ -0,0 +1,116 @@
+from dataclasses import replace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pf_liquidity_risk.configs import public_config
+from pf_liquidity_risk.modeling.train import (
+    NUMBA_AVAILABLE,
+    STATUS_LABELS,
+    PFInvestmentModel,
+    exit_mask,
+    run_simulation,
+    survival_rates,
+)
+
+ENGINES = {
+    "batch": lambda model, n: model.simulate_batch(n, np.random.default_rng(0)),
+    "jit": lambda model, n: model.simulate_jit(n, np.random.default_rng(0)),
+}
+
+
+@pytest.fixture
+def config():
+    return public_config.get_config()
+
+
+def test_run_simulation_columns(config):
+    df, cfg = run_simulation(2000, config=config)
+
+    assert cfg is config
+    assert len(df) == 2000
+    assert {"status", "month", "final_equity", "irr", "exit_multiple"} <= set(df.columns)
+    assert df["month"].between(1, config.exit_month).all()
+    assert list(df["status"].cat.categories) == list(STATUS_LABELS)
+
+
+def test_failed_paths_lose_all_equity(config):
+    df, _ = run_simulation(2000, config=replace(config, initial_equity=60.0, senior_loan=200.0))
+
+    failed = df[df["status"].isin(["default", "refi_fail"])]
+    assert not failed.empty
+    assert (failed["final_equity"] == 0).all()
+    assert (failed["irr"] == -1.0).all()
+
+
+def test_survival_rates_count_failures_by_month():
+    df = pd.DataFrame({
+        "status": ["default", "refi_fail", "exit", "refi_fail", "exit"],
+        "month": [2, 4, 6, 4, 6],
+    })
+
+    np.testing.assert_allclose(
+        survival_rates(df, iterations=5, n_months=6), [1.0, 0.8, 0.8, 0.4, 0.4, 0.4]
+    )
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+@pytest.mark.parametrize("overrides", [{}, {"initial_equity": 60.0, "senior_loan": 200.0}])
+def test_engine_matches_scalar_path(config, overrides, engine):
+    if engine == "jit" and not NUMBA_AVAILABLE:
+        pytest.skip("numba is not installed")
+
+    cfg = replace(config, **overrides)
+    np.random.seed(0)
+    model = PFInvestmentModel(cfg)
+    scalar = model.simulate_paths(5000)
+    batch = ENGINES[engine](model, 5000)
+
+    for status in ("default", "refi_fail", "exit"):
+        expected = (scalar["status"] == status).mean()
+        assert (batch["status"] == status).mean() == pytest.approx(expected, abs=0.02)
+
+
+@pytest.mark.skipif(not NUMBA_AVAILABLE, reason="numba is not installed")
+@pytest.mark.parametrize("overrides", [{}, {"court_opening_month": 18}])
+def test_jit_matches_batch_for_same_draws(config, overrides):
+    model = PFInvestmentModel(
+        replace(config, initial_equity=60.0, senior_loan=200.0, **overrides)
+    )
+    batch = model.simulate_batch(3000, np.random.default_rng(7))
+    jit = model.simulate_jit(3000, np.random.default_rng(7))
+
+    pd.testing.assert_series_equal(jit["status"], batch["status"])
+    pd.testing.assert_frame_equal(jit, batch, check_exact=False, rtol=1e-9)
+
+
+def test_run_simulation_across_workers(config):
+    df, _ = run_simulation(3000, seed=11, config=config, num_workers=2)
+    again, _ = run_simulation(3000, seed=11, config=config, num_workers=2)
+
+    assert len(df) == 3000
+    assert df.index.equals(pd.RangeIndex(3000))
+    assert set(df["status"]) <= {"default", "refi_fail", "exit"}
+    pd.testing.assert_frame_equal(df, again)
+
+
+def test_batch_float32_state_keeps_outcomes(config):
+    model = PFInvestmentModel(replace(config, initial_equity=60.0, senior_loan=200.0))
+    wide = model.simulate_batch(3000, np.random.default_rng(3))
+    narrow = model.simulate_batch(3000, np.random.default_rng(3), dtype=np.float32)
+
+    pd.testing.assert_series_equal(narrow["status"], wide["status"])
+    pd.testing.assert_series_equal(narrow["month"], wide["month"])
+    np.testing.assert_allclose(narrow["irr"], wide["irr"], rtol=1e-4)
+
+
+def test_exit_mask_matches_labels():
+    codes = np.array([2, 0, 2, 1], dtype=np.int8)
+    categorical = pd.DataFrame(
+        {"status": pd.Categorical.from_codes(codes, categories=STATUS_LABELS)}
+    )
+    labels = pd.DataFrame({"status": ["exit", "default", "exit", "refi_fail"]})
+
+    np.testing.assert_array_equal(exit_mask(categorical), [True, False, True, False])
+    np.testing.assert_array_equal(exit_mask(labels), exit_mask(categorical))